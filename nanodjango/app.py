@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import ast
 import inspect
 import os
 import sys
@@ -75,7 +74,9 @@ class Django:
         instance = super().__new__(cls)
 
         # Set app meta
-        app_name = inspect.stack()[1].frame.f_globals["__name__"]
+        # Only the caller's globals are needed - inspect.stack() would read source
+        # context for every frame in the stack
+        app_name = inspect.currentframe().f_back.f_globals["__name__"]
         app_meta._app_module = sys.modules[app_name]
         return instance
 
@@ -164,24 +165,14 @@ class Django:
             # Being called directly with an include
             urlpatterns.append(path_fn(pattern, include))
 
-            # If we're converting, we're going to need the source AST node
-            # Get the full source code, then fine the expression by line number
+            # If we're converting, we're going to need the source AST node. Record
+            # where we were called from, and only parse the source if we convert
             caller_frame = inspect.currentframe().f_back
-            caller_lineno = caller_frame.f_lineno
-            caller_source_lines, _ = inspect.findsource(caller_frame)
-            caller_source = "".join(caller_source_lines)
-            caller_ast = ast.parse(caller_source)
-
-            # Find the node corresponding to the line that called the function
-            source = None
-            for node in ast.walk(caller_ast):
-                if isinstance(node, ast.Expr) and node.lineno == caller_lineno:
-                    source = node
-                    break
+            caller = (caller_frame.f_code.co_filename, caller_frame.f_lineno)
 
             self._routes[pattern] = (
                 None,
-                {"re": re, "include": True, "source": source},
+                {"re": re, "include": True, "caller": caller},
             )
 
             # Make sure this isn't being used as a decorator, that wouldn't make sense
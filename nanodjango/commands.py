@@ -14,7 +14,12 @@ def load_module(module_name: str, path: str | Path):
     return module
 
 
-def load_app(ctx: click.Context, param: str, value: str) -> Django:
+def get_app(value: str) -> Django:
+    """
+    Import an app script or module and return its Django instance
+
+    The value can be a path or module name, optionally followed by ``:<app name>``
+    """
     path = Path(value).absolute()
 
     # Look for the app name
@@ -59,12 +64,16 @@ def load_app(ctx: click.Context, param: str, value: str) -> Django:
     return app
 
 
+def load_app(ctx: click.Context, param: str, value: str) -> Django:
+    return get_app(value)
+
+
 @click.group()
 def cli():
     pass
 
 
-@cli.command()
+@cli.command(context_settings={"allow_interspersed_args": False})
 @click.argument("app", type=str, required=True, callback=load_app)
 @click.argument("args", type=str, required=False, nargs=-1)
 def run(app: Django, args: tuple[str]):
@@ -72,6 +81,8 @@ def run(app: Django, args: tuple[str]):
     Run a management command.
 
     If no command is specified, it will run runserver 0:8000
+
+    Options after the app are passed through to the management command
     """
     app.run(args)
 
@@ -21,6 +21,7 @@ from .utils import (
     collect_references,
     ensure_http_response,
     filter_decorators,
+    find_expr,
     import_from_path,
     is_api_decorator,
     make_url,
@@ -599,7 +600,7 @@ class Converter:
             else:
                 # path(pattern, include)
                 # Extract the ``include`` reference
-                route_ast = url_config["source"]
+                route_ast = find_expr(*url_config["caller"])
                 if (
                     isinstance(route_ast, ast.Expr)
                     and (call := getattr(route_ast, "value"))
@@ -618,9 +619,7 @@ class Converter:
                     urls.append(make_url(pattern, include_src, **url_config))
                     resolver.add_references(references)
                 else:
-                    raise ConversionError(
-                        f"Could not understand route {url_config['source']}"
-                    )
+                    raise ConversionError(f"Could not understand route {pattern}")
             if url_config["re"]:
                 imports.add("re_path")
             else:
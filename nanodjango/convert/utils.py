@@ -3,6 +3,7 @@ from __future__ import annotations
 import ast
 import importlib.util
 import inspect
+import linecache
 from functools import wraps
 from pathlib import Path
 from types import ModuleType
@@ -44,6 +45,23 @@ def obj_to_ast(obj_src: str) -> ast.AST:
     return obj_ast
 
 
+def find_expr(filename: str, lineno: int) -> ast.Expr | None:
+    """
+    Find the expression statement in a source file which spans the given line
+    """
+    linecache.checkcache(filename)
+    source_lines = linecache.getlines(filename)
+    if not source_lines:
+        return None
+
+    for node in ast.walk(ast.parse("".join(source_lines))):
+        if not isinstance(node, ast.Expr):
+            continue
+        if node.lineno <= lineno <= cast(int, node.end_lineno):
+            return node
+    return None
+
+
 def collect_references(node: ast.AST) -> set[str]:
     visitor = ReferenceVisitor()
     visitor.visit(node)
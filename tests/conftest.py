@@ -0,0 +1,28 @@
+import socket
+
+import pytest
+
+from .utils import cmd
+
+
+@pytest.fixture
+def free_bind():
+    """
+    Find a free local port for a test server, so servers can't collide
+    """
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    return f"127.0.0.1:{port}"
+
+
+@pytest.fixture(scope="session")
+def scale_migrated():
+    """
+    Make and apply migrations for the scale example once per session
+
+    Tests using this must be in the "scale" xdist group, so only one worker writes to
+    the example's database and migrations
+    """
+    cmd("run", "examples/scale.py", "makemigrations", "scale", "--skip-checks")
+    cmd("run", "examples/scale.py", "migrate", "--skip-checks")
@@ -0,0 +1,60 @@
+"""
+Test the scale example in-process, using Django's test client
+
+This runs the same requests as the runserver tests without starting a server. Only
+one nanodjango app can be loaded per process, so only one app can be tested this way.
+"""
+
+from pathlib import Path
+
+from django.test import Client
+from django.test.utils import (
+    setup_databases,
+    setup_test_environment,
+    teardown_databases,
+    teardown_test_environment,
+)
+
+import pytest
+
+from .utils import load_app
+
+
+TEST_SCRIPT = Path(__file__).parent.parent / "examples" / "scale.py"
+
+# Shares the scale example's migrations with the other scale tests
+pytestmark = pytest.mark.xdist_group("scale")
+
+
+@pytest.fixture(scope="module")
+def client(scale_migrated):
+    """
+    Load the scale example into this process and return a test client for it
+
+    The app stays loaded after the tests finish. Its module, Django settings, URL
+    patterns and sys.path entry are process-wide and can't be unloaded, so this process
+    can never load another app. With xdist this is the worker; without it, it's the
+    main pytest process.
+
+    Depends on scale_migrated because scale.py sets MIGRATIONS_DIR, and Django can't
+    create the test database until that migrations module exists.
+    """
+    load_app(str(TEST_SCRIPT))
+
+    setup_test_environment()
+    old_config = setup_databases(verbosity=0, interactive=False)
+    try:
+        yield Client()
+    finally:
+        teardown_databases(old_config, verbosity=0)
+        teardown_test_environment()
+
+
+def test_client__fbv_with_model(client):
+    response = client.get("/")
+    assert response.status_code == 200
+    assert b"No books" in response.content
+
+    response = client.get("/count/")
+    assert response.status_code == 200
+    assert b"Number of page loads: 1" in response.content
@@ -1,24 +1,34 @@
-import urllib.request
+import pytest
 
-from .utils import cmd, converted_process, runserver
+from .utils import (
+    RUNSERVER_OPTIONS,
+    cmd,
+    converted_process,
+    http_connection,
+    http_get,
+    runserver,
+)
 
 TEST_APP = "scale"
 TEST_SCRIPT = f"examples/{TEST_APP}.py"
-TEST_BIND = "127.0.0.1:8042"
 
 
-def test_runserver__fbv_with_model(tmp_path):
-    cmd("run", TEST_SCRIPT, "makemigrations", TEST_APP)
-    cmd("run", TEST_SCRIPT, "migrate")
+# Tests using the scale example share its database and migrations, keep them together
+@pytest.mark.xdist_group("scale")
+@pytest.mark.usefixtures("scale_migrated")
+def test_runserver__fbv_with_model(tmp_path, free_bind):
     cmd("convert", TEST_SCRIPT, str(tmp_path), "--name=converted", "--delete")
 
     with (
-        converted_process(tmp_path, "runserver", TEST_BIND) as handle,
-        runserver(handle),
+        converted_process(
+            tmp_path, "runserver", free_bind, *RUNSERVER_OPTIONS
+        ) as server,
+        runserver(server),
+        http_connection(free_bind) as conn,
     ):
-        response = urllib.request.urlopen(f"http://{TEST_BIND}/", timeout=10)
-        assert response.getcode() == 200
+        status, _ = http_get(conn, "/")
+        assert status == 200
 
-        response = urllib.request.urlopen(f"http://{TEST_BIND}/count/", timeout=10)
-        assert response.getcode() == 200
-        assert "Number of page loads" in response.read().decode("utf-8")
+        status, body = http_get(conn, "/count/")
+        assert status == 200
+        assert b"Number of page loads" in body
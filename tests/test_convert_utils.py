@@ -0,0 +1,45 @@
+import ast
+
+from nanodjango.convert.utils import find_expr
+
+
+SOURCE = """from django.urls import include
+
+app.route(
+    "flatpages/",
+    include=include("django.contrib.flatpages.urls"),
+)
+CONSTANT = 1
+"""
+
+
+def test_find_expr__multiline_call(tmp_path):
+    path = tmp_path / "script.py"
+    path.write_text(SOURCE)
+
+    for lineno in (3, 5, 6):
+        node = find_expr(str(path), lineno)
+        assert isinstance(node, ast.Expr)
+        assert ast.unparse(node) == (
+            "app.route('flatpages/', include=include('django.contrib.flatpages.urls'))"
+        )
+
+
+def test_find_expr__not_an_expression(tmp_path):
+    path = tmp_path / "script.py"
+    path.write_text(SOURCE)
+    assert find_expr(str(path), 7) is None
+
+
+def test_find_expr__missing_file(tmp_path):
+    assert find_expr(str(tmp_path / "missing.py"), 1) is None
+
+
+def test_find_expr__file_changed(tmp_path):
+    path = tmp_path / "script.py"
+    path.write_text(SOURCE)
+    assert find_expr(str(path), 7) is None
+
+    path.write_text(SOURCE + "app.route('other/', include=include('other.urls'))\n")
+    node = find_expr(str(path), 8)
+    assert ast.unparse(node) == "app.route('other/', include=include('other.urls'))"
@@ -1,27 +1,24 @@
-from .utils import cmd
-
-
-def test_run_check__counter():
-    result = cmd("run", "examples/counter.py", "check")
-    assert result.stderr.strip() == ""
-    assert result.stdout.strip() == "System check identified no issues (0 silenced)."
-
+import pytest
 
-def test_run_check__counter_app():
-    result = cmd("run", "examples/counter.py:app", "check")
-    assert result.stderr.strip() == ""
-    assert result.stdout.strip() == "System check identified no issues (0 silenced)."
-
-
-def test_run_check__counter_module():
-    result = cmd(
-        "run", "counter:app", "check", cwd="examples", env={"PYTHONPATH": ".."}
-    )
-    assert result.stderr.strip() == ""
-    assert result.stdout.strip() == "System check identified no issues (0 silenced)."
+from .utils import cmd
 
 
-def test_run_check__scale():
-    result = cmd("run", "examples/scale.py", "check")
-    assert result.stderr.strip() == ""
-    assert result.stdout.strip() == "System check identified no issues (0 silenced)."
+@pytest.mark.parametrize(
+    "app, kwargs",
+    [
+        ("examples/counter.py", {}),
+        ("examples/counter.py:app", {}),
+        ("counter:app", {"cwd": "examples", "env": {"PYTHONPATH": ".."}}),
+        ("examples/scale.py", {}),
+    ],
+    ids=["counter", "counter_app", "counter_module", "scale"],
+)
+def test_run_check(app, kwargs):
+    result = cmd("run", app, "check", **kwargs)
+    assert result.stderr.strip() == b""
+    assert result.stdout.strip() == b"System check identified no issues (0 silenced)."
+
+
+def test_run_check__options_passed_through():
+    result = cmd("run", "examples/counter.py", "check", "--deploy")
+    assert b"(security.W018)" in result.stdout + result.stderr
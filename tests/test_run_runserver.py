@@ -1,23 +1,31 @@
-import urllib.request
+import pytest
 
-from .utils import cmd, nanodjango_process, runserver
+from .utils import (
+    RUNSERVER_OPTIONS,
+    http_connection,
+    http_get,
+    nanodjango_process,
+    runserver,
+)
 
 TEST_APP = "scale"
 TEST_SCRIPT = f"examples/{TEST_APP}.py"
-TEST_BIND = "127.0.0.1:8042"
 
 
-def test_runserver__fbv_with_model():
-    cmd("run", TEST_SCRIPT, "makemigrations", TEST_APP)
-    cmd("run", TEST_SCRIPT, "migrate")
-
+# Tests using the scale example share its database and migrations, keep them together
+@pytest.mark.xdist_group("scale")
+@pytest.mark.usefixtures("scale_migrated")
+def test_runserver__fbv_with_model(free_bind):
     with (
-        nanodjango_process("run", TEST_SCRIPT, "runserver", TEST_BIND) as handle,
-        runserver(handle),
+        nanodjango_process(
+            "run", TEST_SCRIPT, "runserver", free_bind, *RUNSERVER_OPTIONS
+        ) as server,
+        runserver(server),
+        http_connection(free_bind) as conn,
     ):
-        response = urllib.request.urlopen(f"http://{TEST_BIND}/", timeout=10)
-        assert response.getcode() == 200
+        status, _ = http_get(conn, "/")
+        assert status == 200
 
-        response = urllib.request.urlopen(f"http://{TEST_BIND}/count/", timeout=10)
-        assert response.getcode() == 200
-        assert "Number of page loads" in response.read().decode("utf-8")
+        status, body = http_get(conn, "/count/")
+        assert status == 200
+        assert b"Number of page loads" in body
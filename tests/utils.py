@@ -1,105 +1,265 @@
+import http.client
 import os
+import signal
 import subprocess
 import sys
-import time
+import threading
 from contextlib import contextmanager
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import django
 
 import pytest
 
 
+if TYPE_CHECKING:
+    from nanodjango import Django
+
+
 TIMEOUT = 10  # seconds
+SETTLE_TIMEOUT = 0.1  # seconds
+
+# runserver only accepts --skip-checks from Django 4.0
+if django.VERSION >= (4, 0, 0):
+    RUNSERVER_OPTIONS = ["--skip-checks"]
+else:
+    RUNSERVER_OPTIONS = []
 
+# Output which shows runserver has started
+if django.VERSION < (5, 0, 0):
+    SERVER_STARTED = "Starting development server at"
+else:
+    SERVER_STARTED = "Watching for file changes"
 
-def cmd(script, *args, fail_ok=False, cwd=None, **kwargs):
+
+def cmd(script, *args, fail_ok=False, cwd=None, env=None, **kwargs):
     """
     Execute a command, and check it was ok (optional)
+
+    Output is captured as bytes. Any ``env`` values are added to the current
+    environment rather than replacing it.
     """
     if cwd is None:
         cwd = Path(__file__).parent.parent
+    if env is not None:
+        env = {**os.environ, **env}
     cmd = [sys.executable, "-mnanodjango", script, *args]
     result = subprocess.run(
         cmd,
         capture_output=True,
-        text=True,
         cwd=cwd,
+        env=env,
         **kwargs,
     )
 
     if fail_ok:
         return result
     elif result.returncode != 0:
-        pytest.fail(f"{' '.join(cmd)} failed: {result.stdout=} {result.stderr=}")
+        stdout = result.stdout.decode(errors="replace")
+        stderr = result.stderr.decode(errors="replace")
+        pytest.fail(f"{' '.join(cmd)} failed: {stdout=} {stderr=}")
     return result
 
 
-@contextmanager
-def nanodjango_process(script: str, *args):
-    handle = subprocess.Popen(
-        [sys.executable, "-mnanodjango", script, *args],
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        text=True,
-        cwd=Path(__file__).parent.parent,
-    )
+def load_app(app: str) -> "Django":
+    """
+    Load an app into this process, ready to handle requests
 
+    This prepares the app the same way ``nanodjango run`` does before it runs a
+    management command. Only one app can ever be loaded per process.
+    """
+    from nanodjango.commands import get_app
+
+    # Django() sets DJANGO_SETTINGS_MODULE, which must not leak into subprocesses
+    # started by other tests, such as the converted project's manage.py
+    old_settings_module = os.environ.get("DJANGO_SETTINGS_MODULE")
     try:
-        yield handle
+        instance = get_app(app)
     finally:
-        handle.terminate()
+        if old_settings_module is None:
+            os.environ.pop("DJANGO_SETTINGS_MODULE", None)
+        else:
+            os.environ["DJANGO_SETTINGS_MODULE"] = old_settings_module
+
+    instance._prepare(with_static=True)
+    return instance
 
 
 @contextmanager
-def converted_process(path: Path, *args):
-    handle = subprocess.Popen(
-        [sys.executable, "manage.py", *args],
+def http_connection(bind: str):
+    """
+    Open a persistent HTTP connection to a test server, reused across requests
+    """
+    host, port = bind.rsplit(":", 1)
+    conn = http.client.HTTPConnection(host, int(port), timeout=TIMEOUT)
+    try:
+        yield conn
+    finally:
+        conn.close()
+
+
+def http_get(conn: http.client.HTTPConnection, path: str) -> tuple[int, bytes]:
+    """
+    Make a GET request on an open connection, returning the status and raw body
+    """
+    conn.request("GET", path)
+    response = conn.getresponse()
+    return response.status, response.read()
+
+
+def popen(args: list[str], cwd: Path) -> subprocess.Popen:
+    """
+    Start a long-running process so that kill() can stop it along with any
+    children, such as the runserver autoreloader
+
+    On POSIX it gets its own session so the whole process group can be killed;
+    on Windows kill() walks the process tree instead.
+    """
+    kwargs = {}
+    if sys.platform != "win32":
+        kwargs["start_new_session"] = True
+
+    return subprocess.Popen(
+        args,
         stdout=subprocess.PIPE,
         stderr=subprocess.PIPE,
-        text=True,
-        cwd=path,
+        cwd=cwd,
+        **kwargs,
     )
 
+
+def kill(handle: subprocess.Popen):
+    """
+    Kill a process started by popen() without waiting for a graceful shutdown
+
+    There is no state to preserve, so there's no need to let the server drain
+    """
+    if sys.platform == "win32":
+        subprocess.run(
+            ["taskkill", "/T", "/F", "/PID", str(handle.pid)],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+    else:
+        try:
+            os.killpg(handle.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+    handle.wait()
+
+
+@contextmanager
+def process(args: list[str], cwd: Path):
+    """
+    Run a long-running process for the duration of the context, and yield an
+    OutputReader draining its output
+    """
+    handle = popen(args, cwd)
+    if not handle.stdout or not handle.stderr:
+        kill(handle)
+        pytest.fail(f"Process did not start correctly: {handle.args}")
+
+    reader = OutputReader(handle.stdout, handle.stderr)
     try:
-        yield handle
+        yield reader
     finally:
-        handle.terminate()
+        kill(handle)
+        reader.close()
 
 
-@contextmanager
-def runserver(server):
-    stdout = server.stdout
-    stderr = server.stderr
-    if not stdout or not stderr:
-        pytest.fail(f"Server did not start correctly: {stdout=} {stderr=}")
+def nanodjango_process(script: str, *args):
+    return process(
+        [sys.executable, "-mnanodjango", script, *args],
+        cwd=Path(__file__).parent.parent,
+    )
+
+
+def converted_process(path: Path, *args):
+    return process([sys.executable, "manage.py", *args], cwd=path)
 
+
+class OutputReader:
+    """
+    Drain a process's output pipes in background threads
+
+    This stops the process blocking on a full pipe while the test is running, and
+    lets the test wait for output to arrive
+    """
+
+    def __init__(self, *pipes):
+        self.pipes = pipes
+        self.out = bytearray()
+        self.open = len(pipes)
+        self.changed = threading.Condition()
+        self.threads = [
+            threading.Thread(target=self.drain, args=(pipe,), daemon=True)
+            for pipe in pipes
+        ]
+        for thread in self.threads:
+            thread.start()
+
+    def drain(self, pipe):
+        while chunk := os.read(pipe.fileno(), 4096):
+            with self.changed:
+                self.out += chunk
+                self.changed.notify_all()
+
+        with self.changed:
+            self.open -= 1
+            self.changed.notify_all()
+
+    def close(self):
+        """
+        Wait for the drain threads to reach the end of the output, then close the
+        pipes
+
+        Call this once the process has exited, so the threads are not left reading
+        from a closed file
+        """
+        for thread in self.threads:
+            thread.join(TIMEOUT)
+        for pipe in self.pipes:
+            pipe.close()
+
+    def wait_for(self, *needles: bytes, timeout: float) -> bool:
+        """
+        Wait until any of the needles is in the output, or all pipes have closed
+        """
+        with self.changed:
+            return self.changed.wait_for(
+                lambda: not self.open or any(needle in self.out for needle in needles),
+                timeout,
+            )
+
+    def wait_quiet(self, timeout: float):
+        """
+        Wait until there has been no new output for the timeout
+        """
+        with self.changed:
+            length = -1
+            while self.open and length != len(self.out):
+                length = len(self.out)
+                self.changed.wait(timeout)
+
+    def output(self) -> str:
+        with self.changed:
+            return self.out.decode(errors="replace")
+
+
+@contextmanager
+def runserver(reader: OutputReader):
     # Wait for server to start
-    if django.VERSION < (5, 0, 0):
-        expecting = "Starting development server at"
-    else:
-        expecting = "Watching for file changes"
-    timeout = time.time() + TIMEOUT
-    out = ""
-    os.set_blocking(stdout.fileno(), False)
-    os.set_blocking(stderr.fileno(), False)
-
-    while time.time() < timeout:
-        out += stdout.readline() + stderr.readline()
-
-        if "Error" in out or expecting in out:
-            # Wait long enough for errors
-            time.sleep(0.5)
-            out += stdout.readline() + stderr.readline()
-            break
-        else:
-            time.sleep(0.1)
+    if reader.wait_for(b"Error", SERVER_STARTED.encode(), timeout=TIMEOUT):
+        # Keep waiting until the output settles, to catch any errors that follow
+        reader.wait_quiet(SETTLE_TIMEOUT)
 
-    if "Error" in out or expecting not in out:
+    out = reader.output()
+    if "Error" in out or SERVER_STARTED not in out:
         pytest.fail(f"Server did not start correctly: {out}")
 
     try:
-        yield server
+        yield
     except Exception:
-        print("".join([out] + stdout.readlines() + stderr.readlines()))
+        print(reader.output())
         raise